@@ -7,22 +7,26 @@ Automates setup, compilation, and running of the Java application.
 Handles Python venv, pip packages, Maven dependencies, and Java compilation.
 
 Usage:
-  python build.py <command> [-v | --help]
+  python build.py <command> [-v | --exec | --purge | --help]
 
 Commands:
   install       Set up Python venv, install Python/Java dependencies.
-  compile       Compile Java source code. Checks for JDK.
+  compile       Compile changed Java sources (incremental). Checks for JDK.
   run           Run the Java application. Checks prerequisites.
-  rebuild       Clean Java classes, then compile.
-  setup         Run 'install' then 'compile'. Full first-time setup.
+  rebuild       Clean Java classes, then compile everything.
+  setup         Run 'install' and 'compile' (compiles while pip installs). Full first-time setup.
   clean         Remove Java classes and Python venv.
   clean-java    Remove compiled Java classes directory only.
-  clean-python  Remove Python virtual environment directory only.
+  clean-python  Remove Python virtual environment only (--purge also deletes its cached copy).
   info          Display detected versions (Java, Maven, Python) and paths.
   help          Display this help message.
 
 Options:
   -v, --verbose   Show detailed command execution output.
+  --purge         With 'clean'/'clean-python': also delete the cached venv that .venv links to,
+                  so the next 'install' builds a fresh one (use it to repair a broken venv).
+  --exec          With 'run' (POSIX only): replace this script's process with the JVM
+                  instead of waiting for it (no resident Python, no closing summary).
   -h, --help      Show this help message and exit.
 
 Requires:
@@ -34,60 +38,104 @@ Requires:
 import os
 import sys
 import subprocess
-import shutil
-import platform
 import argparse
+import collections
+import contextlib
 import re
-import venv
-import textwrap
-import datetime
+import threading
+import functools
 
 # --- Configuration ---
 PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+IS_WINDOWS = os.name == 'nt'
 VENV_DIR = os.path.join(PROJECT_ROOT, ".venv")
 SRC_DIR = os.path.join(PROJECT_ROOT, "TwitterGatherDataFollowers", "userRyersonU")
 LIB_DIR = os.path.join(PROJECT_ROOT, "lib")
+SRC_ROOT = PROJECT_ROOT  # Package root: SRC_DIR holds package 'TwitterGatherDataFollowers.userRyersonU'
 CLASSES_DIR = os.path.join(PROJECT_ROOT, "classes")
+BUILD_CACHE_FILE = os.path.join(CLASSES_DIR, ".build-cache.json")
+CLASSPATH_ARGFILE = os.path.join(CLASSES_DIR, ".classpath") # '-cp "<classpath>"' argfile for javac and java 9+
+CLASSPATH_META_FILE = os.path.join(CLASSES_DIR, ".classpath.meta") # LIB_DIR mtime + JAR list it was built from
+JAVA_VERSION_CACHE_FILE = os.path.join(CLASSES_DIR, ".java_version") # 'java -version' result + the binary it came from
 REQUIREMENTS_FILE = os.path.join(PROJECT_ROOT, "requirements.txt")
+CONSTRAINTS_FILE = os.path.join(PROJECT_ROOT, "constraints.txt") # Optional pins ('pip freeze' of a known-good venv)
 POM_FILE = os.path.join(PROJECT_ROOT, "pom.xml")
+POM_STAMP_FILE = os.path.join(LIB_DIR, ".pom-hash") # POM hash of the last successful Maven download
+REQUIREMENTS_STAMP_FILE = os.path.join(VENV_DIR, ".requirements.sha256") # requirements.txt key of the last pip install
+NLTK_STAMP_FILE = os.path.join(VENV_DIR, ".nltk-data") # Where the last install's NLTK downloads ended up
+NLTK_PACKAGES = {"punkt_tab": "tokenizers/punkt_tab", "wordnet": "corpora/wordnet"} # Package -> nltk.data resource
+BUILD_LOCK_FILE = os.path.join(PROJECT_ROOT, ".build.lock") # Held while dependencies are being installed
+CACHE_ROOT = os.path.join(os.path.expanduser("~"), ".cache", "snsv3") # Venvs (VENV_DIR links here) and libs, keyed by content hash; safe to delete
+VENV_CACHE_KEEP = 3 # Cached venvs kept in CACHE_ROOT; older ones are pruned when a venv is linked
 
 JAVA_MAIN_CLASS = "jade.Boot"
 JAVA_MAIN_AGENT = "controller:TwitterGatherDataFollowers.userRyersonU.ControllerAgent"
 MIN_JAVA_VERSION = 8
+JAVAC_JVM_OPTS = ["-J-Xmx1g", "-J-XX:+UseParallelGC"] # Heap/GC for the javac JVM itself
+JAVAC_MAX_WORKERS = 4 # Concurrent javac processes when sources span several packages
 ALLOWED_PYTHON_VERSIONS = [(3, 9), (3, 10)]
 ALLOWED_PYTHON_VERSIONS_STR = " or ".join([".".join(map(str, v)) for v in ALLOWED_PYTHON_VERSIONS])
+MIN_PIP_VERSION = (24, 0) # Older pip in the venv is upgraded in the same run as the requirements
+PIP_INSTALL_OPTS = ["--no-compile", "--prefer-binary", "--disable-pip-version-check"] # Wheels come from pip's per-user cache
+
+# Version patterns, compiled once
+_PY_VER_RE = re.compile(r"Python (\d+)\.(\d+)(?:\.\d+)?")
+_PYVENV_VER_RE = re.compile(r"^version(?:_info)?\s*=\s*(\d+)\.(\d+)((?:\.\d+)?)", re.MULTILINE)
+_PIP_VER_RE = re.compile(r"pip[- ](\d+)\.(\d+)")
+_JAVA_VER_RE = re.compile(r'(?:java|openjdk)\s+version\s+"(.*?)"', re.IGNORECASE)
+_JAVA_VER_FALLBACK_RE = re.compile(r'version\s+"(.*?)"')
+_JAVA_RELEASE_VER_RE = re.compile(r'^JAVA_VERSION="(.*?)"', re.MULTILINE)
+_JAVA_MAJOR_RE = re.compile(r"(\d+)(?:\.(\d+))?")
+_MVN_VER_RE = re.compile(r"Apache Maven ([\d\.]+)")
+_MVN_CORE_JAR_RE = re.compile(r"maven-core-(\d[\w\.\-]*)\.jar$")
+
+CAPTURED_TAIL_LINES = 200 # Output lines kept from captured commands for error reporting
 
 # --- Global State ---
 VERBOSE = False
+_VENV_ENV_CACHE = None # venv_env_vars() result, reset by clean_py_env()
+_VERSION_SOURCES = {} # Tool -> where fetch_*_version_str() read its version from (shown by 'info')
 
 # --- Helper Functions ---
 
+_OUT = sys.stdout.write # One write per message, without print()'s argument handling
+_WORKER_STEP = threading.local() # 'active' is set while a concurrent install step runs in this thread
+
 def pinfo(message):
     """Prints an informational message."""
-    print(f"[INFO] {message}")
+    _OUT(f"[INFO] {message}\n")
 
 def pwarn(message):
     """Prints a warning message."""
-    print(f"[WARN] {message}")
+    _OUT(f"[WARN] {message}\n")
 
 def perr(message, suggestion=None, exit_code=1):
-    """Prints an error message and exits."""
-    print(f"\n[ERROR] {message}", file=sys.stderr)
+    """Prints an error message to stderr (as a single write) and exits."""
+    error_text = f"\n[ERROR] {message}\n"
     if suggestion:
-        print(f"        Suggestion: {suggestion}", file=sys.stderr)
-    print("\nScript aborted.", file=sys.stderr)
+        error_text += f"        Suggestion: {suggestion}\n"
+    sys.stdout.flush() # Keep already-printed progress ahead of the error
+    # Inside a concurrent install step the other step keeps running; install() reports the abort once
+    if not getattr(_WORKER_STEP, "active", False): error_text += "\nScript aborted.\n"
+    sys.stderr.write(error_text)
     sys.exit(exit_code)
 
 def pv(message):
     """Prints a message only if verbose mode is enabled."""
     global VERBOSE
     if VERBOSE:
-        print(f"  [VERBOSE] {message}")
+        _OUT(f"  [VERBOSE] {message}\n")
+
+@functools.lru_cache(maxsize=None)
+def _which(command):
+    """shutil.which() memoized for the run; PATH lookups (PATHEXT on Windows) don't change mid-run."""
+    import shutil
+    return shutil.which(command)
 
 def check_tool(command, tool_name, install_url=None, required_for_cmd=None):
     """Checks if a command-line tool is available; exits with guidance if not."""
     pinfo(f"Checking for '{tool_name}'...")
-    if shutil.which(command):
+    if _which(command):
         pinfo(f"'{tool_name}' found.")
         return True
     else:
@@ -103,10 +151,12 @@ def check_tool(command, tool_name, install_url=None, required_for_cmd=None):
         perr(error_msg, suggestion)
 
 def run_cmd(cmd, cwd=PROJECT_ROOT, check=True, capture_output_override=None, text=True, env=None, error_msg_on_fail="Command execution failed"):
-    """Runs a command as a subprocess with improved error reporting."""
-    use_shell = False
-    if platform.system() == "Windows":
-        use_shell = True
+    """Runs a command as a subprocess with improved error reporting.
+
+    Captured output (stdout and stderr merged) is spooled by the child straight into a temporary
+    file, so nothing is buffered in Python and the child can never block on a full pipe; the
+    returned CompletedProcess holds the last CAPTURED_TAIL_LINES lines in 'stdout'.
+    """
     global VERBOSE
     cmd_str_display = ' '.join(map(str, cmd))
     pv(f"Running command: {cmd_str_display} in {cwd}")
@@ -115,25 +165,41 @@ def run_cmd(cmd, cwd=PROJECT_ROOT, check=True, capture_output_override=None, tex
 
     capture = not VERBOSE
     if capture_output_override is not None: capture = capture_output_override
-    stdout_pipe = subprocess.PIPE if capture else None
-    stderr_pipe = subprocess.PIPE if capture else None
 
     try:
         cmd_list = [str(c) for c in cmd]
-        process = subprocess.run(
-            cmd_list, cwd=cwd, check=False,
-            stdout=stdout_pipe, stderr=stderr_pipe, text=text,
-            shell=use_shell,
-            env=env or os.environ,
-        )
-
-        if check and process.returncode != 0:
-            error_details = f"{error_msg_on_fail} (Exit Code: {process.returncode})"
+        # Resolve wrappers like mvn.cmd via PATH/PATHEXT ourselves instead of going through cmd.exe
+        exe = _which(cmd_list[0])
+        if exe: cmd_list[0] = exe
+        if capture: import io, tempfile # Only needed to spool captured output
+        with contextlib.ExitStack() as stack:
+            spool = stack.enter_context(tempfile.TemporaryFile()) if capture else None
+            with subprocess.Popen(
+                cmd_list, cwd=cwd,
+                stdout=spool,
+                stderr=subprocess.STDOUT if capture else None,
+                shell=False,
+                env=env or os.environ,
+            ) as process:
+                try:
+                    returncode = process.wait()
+                except KeyboardInterrupt:
+                    process.kill()
+                    raise
+            output = None
+            if capture:
+                spool.seek(0)
+                # Same decoding as a text-mode pipe (locale encoding, universal newlines)
+                lines = io.TextIOWrapper(spool, errors='replace') if text else spool
+                output = ("" if text else b"").join(collections.deque(lines, maxlen=CAPTURED_TAIL_LINES))
+        result = subprocess.CompletedProcess(cmd_list, returncode, stdout=output, stderr=None)
+
+        if check and result.returncode != 0:
+            error_details = f"{error_msg_on_fail} (Exit Code: {result.returncode})"
             error_details += f"\n        Command: {cmd_str_display}"
-            if process.stdout: error_details += "\n--- Captured STDOUT ---\n" + process.stdout.strip() + "\n-----------------------"
-            if process.stderr: error_details += "\n--- Captured STDERR ---\n" + process.stderr.strip() + "\n-----------------------"
+            if result.stdout: error_details += f"\n--- Captured Output (last {CAPTURED_TAIL_LINES} lines) ---\n" + result.stdout.strip() + "\n-----------------------"
             perr(error_details, suggestion="Check the output above for clues. Ensure all prerequisites are met.")
-        return process
+        return result
     except FileNotFoundError:
         perr(f"Command '{cmd[0]}' not found.",
              suggestion=f"Is '{cmd[0]}' installed and included in your system's PATH environment variable?")
@@ -143,21 +209,43 @@ def run_cmd(cmd, cwd=PROJECT_ROOT, check=True, capture_output_override=None, tex
 
 def py_exe_path(venv_dir=VENV_DIR):
     """Gets the expected path to the Python executable within the venv."""
-    if platform.system() == "Windows":
+    if IS_WINDOWS:
         return os.path.join(venv_dir, "Scripts", "python.exe")
     else:
         return os.path.join(venv_dir, "bin", "python")
 
+def _probe_py_version(python_exe):
+    """Reads a Python version without spawning: from this interpreter or the venv's 'pyvenv.cfg'."""
+    if os.path.abspath(python_exe) == os.path.abspath(sys.executable):
+        return f"Python {sys.version.split()[0]}", sys.version_info[:2]
+    cfg_path = os.path.join(os.path.dirname(os.path.dirname(python_exe)), "pyvenv.cfg")
+    try:
+        with open(cfg_path, 'r', encoding='utf-8') as f:
+            match = _PYVENV_VER_RE.search(f.read())
+    except OSError:
+        return None
+    if not match: return None
+    pv(f"Read Python version from: {cfg_path}")
+    return f"Python {match.group(1)}.{match.group(2)}{match.group(3)}", (int(match.group(1)), int(match.group(2)))
+
 def fetch_py_version(python_exe):
-    """Gets the version string and tuple (major, minor) for a Python executable."""
+    """Gets the version string and tuple (major, minor) for a Python executable. Cached per run."""
     if not os.path.exists(python_exe):
         pv(f"Python executable not found at: {python_exe}")
         return None, None
+    # lstat: a recreated venv gets a new 'python' link even when it points at the same interpreter
+    return _fetch_py_version(python_exe, os.lstat(python_exe).st_mtime_ns)
+
+@functools.lru_cache(maxsize=None)
+def _fetch_py_version(python_exe, mtime_ns):
+    """Cached body of fetch_py_version(), keyed on the executable's mtime so a rebuilt venv is re-read."""
+    probed = _probe_py_version(python_exe)
+    if probed: return probed
     try:
         result = run_cmd([python_exe, "--version"], capture_output_override=True, text=True, check=True,
                          error_msg_on_fail=f"Failed to get version from {python_exe}")
-        version_string = (result.stdout or result.stderr).strip()
-        match = re.search(r"Python (\d+)\.(\d+)(?:\.\d+)?", version_string)
+        version_string = (result.stdout or result.stderr or "").strip()
+        match = _PY_VER_RE.search(version_string)
         if match:
             major_minor = (int(match.group(1)), int(match.group(2)))
             return version_string, major_minor
@@ -168,8 +256,33 @@ def fetch_py_version(python_exe):
         pwarn(f"Could not determine Python version for {python_exe}: {e}")
         return "Error", None
 
+def _pip_dist_infos(venv_dir):
+    """Lists the pip '*.dist-info' directories installed in a venv (Windows or POSIX layout)."""
+    import glob
+    return (glob.glob(os.path.join(venv_dir, "Lib", "site-packages", "pip-*.dist-info")) +
+            glob.glob(os.path.join(venv_dir, "lib", "python*", "site-packages", "pip-*.dist-info")))
+
+def fetch_pip_version(python_exe):
+    """Gets the (major, minor) pip version of a venv interpreter, preferring its installed dist-info."""
+    dist_infos = _pip_dist_infos(os.path.dirname(os.path.dirname(python_exe)))
+    output = " ".join(os.path.basename(d) for d in dist_infos)
+    if not output:
+        result = run_cmd([python_exe, "-m", "pip", "--version"], capture_output_override=True, check=False)
+        output = result.stdout or result.stderr or ""
+    match = _PIP_VER_RE.search(output)
+    return (int(match.group(1)), int(match.group(2))) if match else None
+
+def pip_env_vars(base_env=None):
+    """Environment for non-interactive pip runs: no prompts and no PyPI self-update check."""
+    pip_env = (base_env or os.environ).copy()
+    pip_env['PIP_NO_INPUT'] = "1"
+    pip_env['PIP_DISABLE_PIP_VERSION_CHECK'] = "1"
+    return pip_env
+
 def venv_env_vars():
-    """Creates a modified environment dictionary for running subprocesses in the venv context."""
+    """Creates a modified environment dictionary for running subprocesses in the venv context (cached)."""
+    global _VENV_ENV_CACHE
+    if _VENV_ENV_CACHE is not None: return _VENV_ENV_CACHE
     pv(f"Attempting to create execution environment based on venv: {VENV_DIR}")
     if not os.path.isdir(VENV_DIR):
         pwarn(f"Virtual environment directory not found at {VENV_DIR}. Cannot create venv-specific environment.")
@@ -190,20 +303,85 @@ def venv_env_vars():
     if 'PYTHONHOME' in modified_env:
         del modified_env['PYTHONHOME']
         pv("Removed PYTHONHOME from subprocess environment for venv compatibility.")
+    _VENV_ENV_CACHE = modified_env
     return modified_env
 
+def _tool_home(command):
+    """Resolves a PATH command through symlinks to its installation root (the parent of 'bin')."""
+    exe = _which(command)
+    if not exe: return None
+    return os.path.dirname(os.path.dirname(os.path.realpath(exe)))
+
+def _probe_java_version(java_home):
+    """Reads JAVA_VERSION from the JDK 'release' file (also checks the parent of a JDK 8 'jre' dir)."""
+    for release_file in [os.path.join(java_home, "release"), os.path.join(os.path.dirname(java_home), "release")]:
+        try:
+            with open(release_file, 'r', encoding='utf-8') as f:
+                match = _JAVA_RELEASE_VER_RE.search(f.read())
+        except OSError:
+            continue
+        if match:
+            pv(f"Read Java version from: {release_file}")
+            _VERSION_SOURCES["java"] = release_file
+            return match.group(1)
+    return None
+
+def _jdk_tool_key(command):
+    """Identifies a JDK tool on PATH by [real path, mtime, JAVA_HOME]; changes when the JDK is switched or updated.
+
+    JAVA_HOME is part of the key because launcher stubs (e.g. macOS '/usr/bin/java') pick the JDK from it.
+    """
+    exe = os.path.realpath(_which(command))
+    return [exe, os.path.getmtime(exe), os.environ.get("JAVA_HOME")]
+
+def _read_cached_java_version(java_key):
+    """Returns the version recorded in JAVA_VERSION_CACHE_FILE for this java binary, or None."""
+    import json
+    try:
+        with open(JAVA_VERSION_CACHE_FILE, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        if cached["java"] == java_key: return cached["version"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+def _write_cached_java_version(java_key, version):
+    """Records a parsed 'java -version' result so later runs skip the JVM start (only if CLASSES_DIR exists)."""
+    import json
+    if not os.path.isdir(CLASSES_DIR): return
+    try:
+        with open(JAVA_VERSION_CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump({"java": java_key, "version": version}, f)
+    except OSError as e:
+        pv(f"Could not write {JAVA_VERSION_CACHE_FILE}: {e}")
+
+@functools.lru_cache(maxsize=None)
 def fetch_java_version_str():
-    """Detects installed Java version string. Returns None if not found."""
+    """Detects installed Java version string. Returns None if not found. Cached per run.
+
+    Without a JDK 'release' file, the 'java -version' result is persisted in JAVA_VERSION_CACHE_FILE.
+    """
+    java_home = _tool_home("java")
+    if not java_home: return None
+    probed = _probe_java_version(java_home)
+    if probed: return probed
+    java_key = _jdk_tool_key("java")
+    cached = _read_cached_java_version(java_key)
+    if cached:
+        pv(f"Read Java version from: {JAVA_VERSION_CACHE_FILE}")
+        _VERSION_SOURCES["java"] = "cached 'java -version'"
+        return cached
     try:
         result = run_cmd(["java", "-version"], capture_output_override=True, text=True, check=False)
         if result.returncode != 0 and "command not found" not in (result.stderr or result.stdout).lower():
              pwarn(f"Command 'java -version' failed. Output:\n{result.stderr or result.stdout}")
              return "Error"
         output = result.stderr or result.stdout
-        match = re.search(r'(?:java|openjdk)\s+version\s+"(.*?)"', output, re.IGNORECASE)
-        if match: return match.group(1)
-        match_simple = re.search(r'version\s+"(.*?)"', output) # Fallback
-        if match_simple: return match_simple.group(1)
+        match = _JAVA_VER_RE.search(output) or _JAVA_VER_FALLBACK_RE.search(output) # Fallback
+        if match:
+            _write_cached_java_version(java_key, match.group(1))
+            _VERSION_SOURCES["java"] = "'java -version'"
+            return match.group(1)
         pv(f"Could not parse Java version from output:\n{output}")
         return "Unknown format"
     except FileNotFoundError: return None
@@ -212,29 +390,356 @@ def fetch_java_version_str():
 def fetch_java_major_ver(version_string):
     """Extracts the major Java version number (e.g., 8, 11, 17) from a string."""
     if not version_string or version_string in ["Unknown format", "Error", None]: return None
-    match = re.match(r"(\d+)(?:.(\d+))?", version_string)
+    match = _JAVA_MAJOR_RE.match(version_string)
     if match:
         major = int(match.group(1))
         return int(match.group(2)) if major == 1 and match.group(2) else major # Handle 1.8 format
     return None
 
+def _probe_mvn_version(maven_home):
+    """Reads the Maven version from the 'maven-core-<version>.jar' shipped in the Maven home."""
+    import glob
+    for lib_dir in [os.path.join(maven_home, "lib"), os.path.join(maven_home, "libexec", "lib")]:
+        for jar in glob.glob(os.path.join(lib_dir, "maven-core-*.jar")):
+            match = _MVN_CORE_JAR_RE.match(os.path.basename(jar))
+            if match:
+                pv(f"Read Maven version from: {jar}")
+                _VERSION_SOURCES["mvn"] = jar
+                return match.group(1)
+    return None
+
+@functools.lru_cache(maxsize=None)
 def fetch_mvn_version_str():
-    """Detects installed Maven version string. Returns None if not found."""
+    """Detects installed Maven version string. Returns None if not found. Cached per run."""
+    maven_home = _tool_home("mvn")
+    if not maven_home: return None
+    probed = _probe_mvn_version(maven_home)
+    if probed: return probed
     try:
         result = run_cmd(["mvn", "--version"], capture_output_override=True, text=True, check=False)
         if result.returncode != 0 and "command not found" not in (result.stderr or result.stdout).lower():
              pwarn(f"Command 'mvn --version' failed. Output:\n{result.stderr or result.stdout}")
              return "Error"
         output = result.stdout or result.stderr
-        match = re.search(r"Apache Maven ([\d\.]+)", output)
-        if match: return match.group(1)
+        match = _MVN_VER_RE.search(output)
+        if match: _VERSION_SOURCES["mvn"] = "'mvn --version'"; return match.group(1)
         pv(f"Could not parse Maven version from output:\n{output}")
         return "Unknown format"
     except FileNotFoundError: return None
     except Exception as e: pwarn(f"Error detecting Maven version: {e}"); return "Error"
 
+def _iter_java(directory):
+    """Yields '.java' files under a directory, using cached DirEntry types instead of extra stat calls.
+
+    Hidden directories ('.git', '.idea', ...) are not descended into; hidden files are still yielded.
+    """
+    with os.scandir(directory) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                if not entry.name.startswith("."): yield from _iter_java(entry.path)
+            elif entry.name.endswith(".java") and entry.is_file():
+                yield entry.path
+
+@functools.lru_cache(maxsize=None)
+def _scan_lib_jars(lib_dir, lib_mtime):
+    """Lists the '.jar' files directly inside a directory, sorted. Cached per (dir, mtime)."""
+    with os.scandir(lib_dir) as it:
+        return tuple(sorted(entry.path for entry in it if entry.name.endswith(".jar") and entry.is_file()))
+
+def _lib_jars():
+    """Returns the paths of the '.jar' files in LIB_DIR ([] if it is missing), rescanned only when its mtime changes."""
+    if not os.path.isdir(LIB_DIR): return []
+    return list(_scan_lib_jars(LIB_DIR, os.path.getmtime(LIB_DIR)))
+
+def _get_classpath():
+    """Returns (classpath_str, lib_jars) for CLASSES_DIR + LIB_DIR JARs.
+
+    The JAR listing is cached in CLASSPATH_META_FILE and reused while LIB_DIR's mtime is unchanged
+    (adding or removing a JAR bumps it). CLASSPATH_ARGFILE is rewritten whenever the listing is.
+    """
+    import json
+    lib_mtime = os.path.getmtime(LIB_DIR) if os.path.isdir(LIB_DIR) else None
+    try:
+        with open(CLASSPATH_META_FILE, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        if (meta["lib_mtime"] == lib_mtime and meta["classes_dir"] == CLASSES_DIR
+                and os.path.exists(CLASSPATH_ARGFILE)):
+            pv(f"Reusing cached classpath: {CLASSPATH_META_FILE}")
+            return os.pathsep.join([CLASSES_DIR] + meta["jars"]), meta["jars"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    lib_jars = _lib_jars()
+    classpath_str = os.pathsep.join([CLASSES_DIR] + lib_jars)
+    if os.path.isdir(CLASSES_DIR):
+        try:
+            with open(CLASSPATH_ARGFILE, 'w', encoding='utf-8') as cf:
+                # Forward slashes: backslash is an escape character in javac/java argument files
+                cf.write(f'-cp\n"{classpath_str.replace(chr(92), "/")}"\n')
+            with open(CLASSPATH_META_FILE, 'w', encoding='utf-8') as f:
+                json.dump({"lib_mtime": lib_mtime, "classes_dir": CLASSES_DIR, "jars": lib_jars}, f)
+            pv(f"Wrote classpath argument file: {CLASSPATH_ARGFILE}")
+        except OSError as e:
+            pwarn(f"Could not cache classpath in {CLASSES_DIR}: {e}")
+    return classpath_str, lib_jars
+
+def _class_file(java_file):
+    """Maps a '.java' source to the top-level '.class' file javac writes for it under CLASSES_DIR."""
+    rel_path = os.path.relpath(java_file, SRC_ROOT)
+    return os.path.join(CLASSES_DIR, os.path.splitext(rel_path)[0] + ".class")
+
+def _has_class_files(directory):
+    """True if any '.class' file exists under a directory (stops at the first one; ignores build metadata)."""
+    with os.scandir(directory) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                if _has_class_files(entry.path): return True
+            elif entry.name.endswith(".class"):
+                return True
+    return False
+
+def _load_build_cache():
+    """Loads the classpath and {source: [mtime, size, sha1]} map recorded by the last successful compilation."""
+    import json
+    try:
+        with open(BUILD_CACHE_FILE, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        return cache if isinstance(cache.get("sources"), dict) else {}
+    except (OSError, ValueError, AttributeError):
+        return {}
+
+def _file_sha1(path):
+    """Hex sha1 of a file's bytes."""
+    import hashlib
+    with open(path, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+def _source_entry(java_file, cached=None):
+    """Build cache entry [mtime, size, sha1] for a source; the sha1 is reused while mtime and size match."""
+    st = os.stat(java_file)
+    if cached and len(cached) == 3 and cached[:2] == [st.st_mtime, st.st_size]: return cached
+    return [st.st_mtime, st.st_size, _file_sha1(java_file)]
+
+def _save_build_cache(java_files, classpath_str, compiler_key, source_stats=None):
+    """Records the classpath, the compiler and the [mtime, size, sha1] of every source after a successful compilation."""
+    import json
+    source_stats = source_stats or {}
+    sources = {java_file: _source_entry(java_file, source_stats.get(java_file)) for java_file in java_files}
+    cache = {"classpath": classpath_str, "compiler": compiler_key, "sources": sources}
+    try:
+        with open(BUILD_CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+        pv(f"Updated build cache: {BUILD_CACHE_FILE}")
+    except OSError as e:
+        pwarn(f"Could not write build cache {BUILD_CACHE_FILE}: {e}")
+
+def _stale_sources(java_files, source_stats):
+    """Returns (stale, touched): the sources that need recompiling plus the sources that reference
+    them, and the sources whose timestamp changed but whose content did not.
+
+    A source is stale if its class file is missing, or if it is newer than its class file or its
+    (mtime, size) no longer matches what the last compilation recorded (catches files replaced with
+    an older timestamp, e.g. extracted from an archive) - unless its sha1 still matches the recorded
+    one. Only sources whose mtime or size moved are hashed.
+    """
+    changed, touched = [], []
+    for java_file in java_files:
+        class_file = _class_file(java_file)
+        if not os.path.exists(class_file): changed.append(java_file); continue
+        st = os.stat(java_file)
+        cached = source_stats.get(java_file)
+        if cached and len(cached) == 3 and cached[:2] == [st.st_mtime, st.st_size]: continue
+        if not (st.st_mtime > os.path.getmtime(class_file) or cached is not None): continue
+        if cached and len(cached) == 3 and cached[2] == _file_sha1(java_file): touched.append(java_file)
+        else: changed.append(java_file)
+    if touched: pv(f"{len(touched)} source(s) touched without content changes.")
+    if not changed or len(changed) == len(java_files): return changed, touched
+
+    # Dependents: any other source mentioning a changed class by simple name (same-package
+    # references need no import, so a plain word match is the conservative choice). The pattern
+    # depends on the changed names, so it is compiled once per call rather than hoisted.
+    names = {os.path.splitext(os.path.basename(f))[0] for f in changed}
+    name_pattern = re.compile(r"\b(?:" + "|".join(map(re.escape, sorted(names))) + r")\b")
+    changed_set = set(changed)
+    dependents = []
+    for java_file in java_files:
+        if java_file in changed_set: continue
+        try:
+            with open(java_file, 'r', encoding='utf-8', errors='replace') as f:
+                if name_pattern.search(f.read()): dependents.append(java_file)
+        except OSError:
+            dependents.append(java_file)
+    pv(f"{len(changed)} changed source(s), {len(dependents)} dependent source(s).")
+    return changed + dependents, touched
+
+def _content_key(path, *extra):
+    """Short sha256 of a file's bytes plus any extra strings that must also match."""
+    import hashlib
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        digest.update(f.read())
+    for value in extra:
+        digest.update(b"\0" + value.encode('utf-8'))
+    return digest.hexdigest()[:16]
+
+def _read_stamp(stamp_file):
+    """Reads a content-key stamp file; returns None if it is missing."""
+    try:
+        with open(stamp_file, 'r', encoding='utf-8') as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+def _write_stamp(stamp_file, key):
+    """Records a content key next to the outputs it was produced from."""
+    try:
+        with open(stamp_file, 'w', encoding='utf-8') as f:
+            f.write(key + "\n")
+    except OSError as e:
+        pwarn(f"Could not write stamp file {stamp_file}: {e}")
+
+def _requirements_key(*extra):
+    """Content key of REQUIREMENTS_FILE plus CONSTRAINTS_FILE (when present) and any extra strings."""
+    if os.path.exists(CONSTRAINTS_FILE):
+        with open(CONSTRAINTS_FILE, 'r', encoding='utf-8') as f:
+            extra += (f.read(),)
+    return _content_key(REQUIREMENTS_FILE, *extra)
+
+def _pip_requirement_args():
+    """'-r requirements.txt' plus '-c constraints.txt' when pins exist (skips resolver backtracking)."""
+    args = ["-r", REQUIREMENTS_FILE]
+    if os.path.exists(CONSTRAINTS_FILE): args += ["-c", CONSTRAINTS_FILE]
+    return args
+
+def _venv_cache_dir():
+    """Cache slot for the venv, keyed by the requirements and the Python building it. VENV_DIR links here."""
+    return os.path.join(CACHE_ROOT, f"venv-{_requirements_key(sys.version)}")
+
+def _lib_cache_dir():
+    """Cache slot for the Maven-downloaded JARs, keyed by the POM contents."""
+    return os.path.join(CACHE_ROOT, f"lib-{_content_key(POM_FILE)}")
+
+def _save_to_cache(source_dir, cache_dir):
+    """Copies a directory into its cache slot (via a temp dir + rename so partial copies never match)."""
+    import shutil
+    if os.path.isdir(cache_dir): return
+    tmp_dir = f"{cache_dir}.tmp-{os.getpid()}"
+    try:
+        os.makedirs(CACHE_ROOT, exist_ok=True)
+        shutil.copytree(source_dir, tmp_dir, symlinks=True)
+        os.replace(tmp_dir, cache_dir)
+        pinfo(f"Cached {os.path.basename(source_dir)} at: {cache_dir}")
+    except OSError as e:
+        pwarn(f"Could not cache {source_dir} at {cache_dir}: {e}")
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+def _restore_from_cache(cache_dir, target_dir):
+    """Copies a cached directory into place. Returns True on success."""
+    import shutil
+    try:
+        shutil.copytree(cache_dir, target_dir, symlinks=True, dirs_exist_ok=True)
+        pinfo(f"Restored {os.path.basename(target_dir)} from cache: {cache_dir}")
+        return True
+    except OSError as e:
+        pwarn(f"Could not restore {target_dir} from cache {cache_dir}: {e}")
+        return False
+
+def _is_dir_link(path):
+    """True for a directory symlink, or a junction on Windows."""
+    import stat
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return False
+    return stat.S_ISLNK(st.st_mode) or bool(getattr(st, "st_file_attributes", 0) & stat.FILE_ATTRIBUTE_REPARSE_POINT)
+
+def _remove_dir_link(path):
+    """Removes a directory link without touching its target."""
+    if IS_WINDOWS: os.rmdir(path) # Directory symlinks and junctions are removed like directories
+    else: os.unlink(path)
+
+def _remove_venv_tree(path):
+    """Deletes a venv directory, clearing its site-packages subtrees in parallel."""
+    import glob
+    site_packages = (glob.glob(os.path.join(path, "Lib", "site-packages")) +
+                     glob.glob(os.path.join(path, "lib", "python*", "site-packages")))
+    _fast_rmtree(path, parallel_parents=site_packages)
+
+def _remove_cached_venv(slot_dir):
+    """Deletes one cached venv slot (only paths directly inside CACHE_ROOT)."""
+    slot_dir = os.path.realpath(slot_dir)
+    if os.path.dirname(slot_dir) != os.path.realpath(CACHE_ROOT) or not os.path.isdir(slot_dir): return
+    pinfo(f"Removing cached venv: {slot_dir}")
+    try:
+        _remove_venv_tree(slot_dir)
+    except OSError as e:
+        pwarn(f"Could not remove cached venv {slot_dir}: {e}")
+
+def _prune_venv_cache(keep_dir):
+    """Deletes all but the VENV_CACHE_KEEP most recently linked venv slots in CACHE_ROOT (never `keep_dir`).
+
+    A checkout still linked to a pruned slot gets a fresh venv on its next 'install'.
+    """
+    import glob
+    keep_dir = os.path.realpath(keep_dir)
+    slots = [entry for entry in glob.glob(os.path.join(CACHE_ROOT, "venv-*"))
+             if ".tmp-" not in entry and os.path.realpath(entry) != keep_dir and os.path.isdir(entry)]
+    slots.sort(key=os.path.getmtime, reverse=True)
+    for slot_dir in slots[VENV_CACHE_KEEP - 1:]:
+        pv(f"Pruning least recently used cached venv: {slot_dir}")
+        _remove_cached_venv(slot_dir)
+
+def _link_cached_venv():
+    """Points VENV_DIR at its content-keyed slot under CACHE_ROOT, creating the slot if needed.
+
+    Uses a symlink, or a junction on Windows when symlinks need privileges. A real VENV_DIR directory
+    is left alone (returns False), as is any setup where no link can be created.
+    """
+    cache_dir = _venv_cache_dir()
+    if _is_dir_link(VENV_DIR):
+        if os.path.realpath(VENV_DIR) == os.path.realpath(cache_dir): return True
+        pinfo("Python requirements changed. Switching the venv link to a matching cached venv.")
+        _remove_dir_link(VENV_DIR) # The old slot stays cached, so switching back is instant
+    elif os.path.exists(VENV_DIR):
+        return False
+    os.makedirs(cache_dir, exist_ok=True)
+    os.utime(cache_dir) # Marks the slot as recently used for _prune_venv_cache()
+    try:
+        try:
+            os.symlink(cache_dir, VENV_DIR, target_is_directory=True)
+        except OSError:
+            if not IS_WINDOWS: raise
+            # Symlinks need Developer Mode or admin rights on Windows; junctions do not
+            result = subprocess.run(["cmd", "/c", "mklink", "/J", VENV_DIR, cache_dir],
+                                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+            if result.returncode != 0: raise OSError(f"'mklink /J' failed with exit code {result.returncode}")
+    except OSError as e:
+        pwarn(f"Could not link {VENV_DIR} to the venv cache ({e}). Using a local venv instead.")
+        return False
+    pinfo(f"Linked {VENV_DIR} -> {cache_dir}")
+    _prune_venv_cache(cache_dir)
+    return True
+
 # --- Core Script Functions ---
 
+def fast_venv_builder():
+    """Returns an EnvBuilder that symlinks the interpreter on POSIX and only bootstraps pip when missing."""
+    import venv # Only needed when a venv is actually created
+
+    class FastVenvBuilder(venv.EnvBuilder):
+        def __init__(self):
+            super().__init__(with_pip=False, symlinks=not IS_WINDOWS, clear=False, upgrade_deps=False)
+
+        def post_setup(self, context):
+            if _pip_dist_infos(context.env_dir):
+                pv("pip already present in venv. Skipping ensurepip.")
+                return
+            pinfo("Bootstrapping pip in venv (ensurepip)...")
+            run_cmd([context.env_exe, "-Im", "ensurepip", "--upgrade", "--default-pip"],
+                    env=pip_env_vars(), error_msg_on_fail="Failed to bootstrap pip in venv")
+
+    return FastVenvBuilder()
+
 def ensure_venv():
     """Ensures the Python virtual environment exists and is compatible."""
     pinfo(f"Ensuring Python {ALLOWED_PYTHON_VERSIONS_STR} virtual environment exists at: {VENV_DIR}")
@@ -247,11 +752,12 @@ def ensure_venv():
         #      pwarn(f"Removing existing incomplete venv directory: {VENV_DIR}")
         #      shutil.rmtree(VENV_DIR)
         try:
-            venv.create(VENV_DIR, with_pip=True)
+            # Build at the resolved path: venv refuses a symlinked target, and hard-codes this path
+            fast_venv_builder().create(os.path.realpath(VENV_DIR))
             pinfo("Virtual environment created successfully.")
             if not os.path.exists(py_exe_path()):
                  perr("Venv creation reported success, but Python executable is missing inside!",
-                      suggestion=f"Check permissions or disk space. Try running 'clean-python' then 'install'.")
+                      suggestion=f"Check permissions or disk space. Try running 'clean-python --purge' then 'install'.")
         except Exception as e:
             perr(f"Failed to create virtual environment: {e}",
                  suggestion=f"Please create the virtual environment manually:\n"
@@ -265,16 +771,22 @@ def ensure_venv():
         if version_tuple and version_tuple not in ALLOWED_PYTHON_VERSIONS:
             pwarn(f"Existing venv at '{VENV_DIR}' uses Python {version_str}, "
                   f"but this project requires Python {ALLOWED_PYTHON_VERSIONS_STR}.")
-            pwarn(f"This might cause issues. If problems occur, run 'clean-python', "
+            pwarn(f"This might cause issues. If problems occur, run 'clean-python --purge', "
                   f"then run 'install' again (using Python {ALLOWED_PYTHON_VERSIONS_STR}).")
         elif not version_tuple:
              pwarn(f"Could not determine Python version for the existing venv at {venv_python_exe}.")
         else:
              pinfo(f"Existing venv uses Python {version_str} (compatible).")
 
-def install():
-    """Installs Java (Maven) and Python (pip) dependencies."""
-    pinfo("\n--- Step 1: Installing Java Dependencies (via Maven) ---")
+def _install_maven_deps():
+    """Downloads Java dependencies into LIB_DIR via Maven."""
+    pinfo("\n--- Installing Java Dependencies (via Maven) ---")
+    lib_empty = not _lib_jars()
+    if not lib_empty and os.path.exists(POM_FILE) and _read_stamp(POM_STAMP_FILE) == _content_key(POM_FILE):
+        pinfo(f"{os.path.basename(POM_FILE)} unchanged since the last download. Skipping Maven.")
+        return
+    if lib_empty and os.path.exists(POM_FILE) and os.path.isdir(_lib_cache_dir()):
+        if _restore_from_cache(_lib_cache_dir(), LIB_DIR): return
     check_tool("mvn", "Apache Maven",
                install_url="https://maven.apache.org/install.html",
                required_for_cmd="install")
@@ -284,51 +796,270 @@ def install():
     else:
         pinfo(f"Found {POM_FILE}. Downloading Java dependencies to: {LIB_DIR}")
         os.makedirs(LIB_DIR, exist_ok=True)
-        mvn_cmd = ["mvn", "dependency:copy-dependencies", "-DoutputDirectory=" + LIB_DIR, "-DskipTests=true", "-q"]
+        mvn_cmd = ["mvn", "-T", "1C", "-B", "-Dmaven.artifact.threads=8",
+                   "-Dmaven.wagon.http.pool=true", "-Dmaven.wagon.httpconnectionManager.ttlSeconds=120",
+                   "dependency:copy-dependencies", f"-DoutputDirectory={LIB_DIR}", "-DskipTests=true", "-q"]
         try:
-            run_cmd(mvn_cmd, error_msg_on_fail="Maven dependency download failed")
+            # After the first download the local repository usually has everything: try offline first
+            offline_ok = False
+            if not lib_empty:
+                offline_ok = run_cmd(mvn_cmd + ["-o"], check=False).returncode == 0
+                if not offline_ok: pinfo("Offline resolution incomplete. Retrying with network access...")
+            if not offline_ok:
+                run_cmd(mvn_cmd, error_msg_on_fail="Maven dependency download failed")
             pinfo("Maven dependencies downloaded successfully.")
+            _write_stamp(POM_STAMP_FILE, _content_key(POM_FILE))
+            _save_to_cache(LIB_DIR, _lib_cache_dir())
         except Exception as e:
             perr(f"An unexpected error occurred during Maven execution: {e}",
                  suggestion="Check your network connection and Maven setup.")
 
-    pinfo("\n--- Step 2: Setting up Python Environment & Dependencies (venv + pip) ---")
+# Runs 'pip <args>' (exactly as 'python -m pip' would) and then the NLTK downloads in one interpreter,
+# so nltk is imported from the packages pip just installed. Exit codes: 0 ok, 1 pip failed, 2 NLTK failed.
+# After a good download it records the on-disk location nltk resolves for each resource in the stamp file.
+_SETUP_SESSION_SCRIPT = """\
+import importlib, json, runpy, sys
+spec = json.loads(sys.argv[1])
+if spec["pip"]:
+    sys.argv = ["pip"] + spec["pip"]
+    try:
+        runpy.run_module("pip", run_name="__main__", alter_sys=True)
+    except SystemExit as e:
+        if e.code not in (0, None): sys.exit(1)
+    importlib.invalidate_caches()
+if spec["nltk"]:
+    try:
+        import nltk
+        ok = all([nltk.download(pkg, quiet=True) for pkg in spec["nltk"]])
+        if ok:
+            found = [nltk.data.find(res) for res in spec["nltk"].values()]
+            paths = [getattr(ptr, "path", None) or ptr.zipfile.filename for ptr in found]
+            with open(spec["stamp"], "w", encoding="utf-8") as f:
+                json.dump({"packages": spec["nltk"], "nltk_data": spec["nltk_data"], "paths": paths}, f)
+    except Exception as e:
+        print(f"NLTK download error: {e}")
+        ok = False
+    sys.exit(0 if ok else 2)
+"""
+
+def _nltk_data_present():
+    """True if the last install's NLTK data is still on disk where nltk found it (same NLTK_DATA)."""
+    import json
+    try: stamp = json.loads(_read_stamp(NLTK_STAMP_FILE) or "")
+    except ValueError: return False
+    if not isinstance(stamp, dict) or stamp.get("packages") != NLTK_PACKAGES: return False
+    if stamp.get("nltk_data") != os.environ.get("NLTK_DATA"): return False
+    paths = stamp.get("paths")
+    return bool(paths) and all(os.path.exists(path) for path in paths)
+
+def _prepare_venv():
+    """Creates/validates the venv. Returns the venv python."""
     ensure_venv()
     python_exe = py_exe_path()
     if not os.path.exists(python_exe):
         perr(f"Python executable not found in venv: {python_exe}",
-             suggestion="Try running 'clean-python' then 'install'.")
-
-    pinfo("Upgrading pip in venv...")
-    run_cmd([python_exe, "-m", "pip", "install", "--upgrade", "pip"], error_msg_on_fail="Failed to upgrade pip")
-
-    pinfo(f"Installing Python packages from: {REQUIREMENTS_FILE}")
+             suggestion="Try running 'clean-python --purge' then 'install'.")
+    return python_exe
+
+def _pip_install_args(python_exe):
+    """pip arguments installing REQUIREMENTS_FILE; an outdated pip is upgraded in the same run."""
+    pip_args = ["install"] + PIP_INSTALL_OPTS
+    pip_version = fetch_pip_version(python_exe)
+    if pip_version and pip_version >= MIN_PIP_VERSION:
+        pinfo(f"pip {'.'.join(map(str, pip_version))} in venv is recent enough. Skipping upgrade.")
+    else:
+        pinfo("pip in venv is outdated. It will be upgraded along with the requirements.")
+        # A requirement spec, not '--upgrade pip': '--upgrade' would apply to every (unpinned) requirement
+        pip_args.append(f"pip>={'.'.join(map(str, MIN_PIP_VERSION))}")
+    return pip_args + _pip_requirement_args()
+
+def _install_python_deps():
+    """Sets up the venv, installs pip packages, then downloads NLTK data (which needs nltk installed)."""
+    import json
+    pinfo("\n--- Setting up Python Environment & Dependencies (venv + pip) ---")
     if not os.path.exists(REQUIREMENTS_FILE):
         perr(f"Python requirements file not found: {REQUIREMENTS_FILE}",
              suggestion="Ensure the file exists in the project root.")
-    run_cmd([python_exe, "-m", "pip", "install", "-r", REQUIREMENTS_FILE], error_msg_on_fail="Failed to install Python packages")
-    pinfo("Python packages installed successfully.")
-
-    pinfo("Downloading NLTK data (punkt, wordnet)...")
-    nltk_cmd_str = "import nltk; nltk.download('punkt_tab', quiet=True); nltk.download('wordnet', quiet=True)"
-    result = run_cmd([python_exe, "-c", nltk_cmd_str], check=False, error_msg_on_fail="NLTK download command error")
+    _link_cached_venv() # A previously built venv for these requirements makes the install below a no-op
+    requirements_key = _requirements_key()
+    python_exe = py_exe_path()
+    pip_args = None
+    if os.path.exists(python_exe) and _read_stamp(REQUIREMENTS_STAMP_FILE) == requirements_key:
+        pinfo(f"{os.path.basename(REQUIREMENTS_FILE)} unchanged since the last install. Skipping pip.")
+    else:
+        python_exe = _prepare_venv()
+        if _which("uv"):
+            # uv resolves and downloads in parallel; pip downloads one wheel at a time
+            pinfo(f"Installing Python packages from: {REQUIREMENTS_FILE} (via uv)")
+            run_cmd(["uv", "pip", "install", "--python", python_exe] + _pip_requirement_args(),
+                    env=pip_env_vars(), error_msg_on_fail="Failed to install Python packages with uv")
+            pinfo("Python packages installed successfully.")
+            _write_stamp(REQUIREMENTS_STAMP_FILE, requirements_key)
+        else:
+            pip_args = _pip_install_args(python_exe)
+
+    nltk_packages = NLTK_PACKAGES
+    if _nltk_data_present():
+        pinfo("NLTK data already downloaded. Skipping.")
+        nltk_packages = {}
+    if not pip_args and not nltk_packages: return
+
+    if pip_args: pinfo(f"Installing Python packages from: {REQUIREMENTS_FILE}")
+    if nltk_packages: pinfo(f"Downloading NLTK data ({', '.join(nltk_packages)})...")
+    session_spec = json.dumps({"pip": pip_args, "nltk": nltk_packages, "stamp": NLTK_STAMP_FILE,
+                               "nltk_data": os.environ.get("NLTK_DATA")})
+    result = run_cmd([python_exe, "-I", "-c", _SETUP_SESSION_SCRIPT, session_spec], check=False, env=pip_env_vars())
+    if result.returncode not in (0, 2):
+        error_details = f"Failed to install Python packages (Exit Code: {result.returncode})"
+        if result.stdout: error_details += "\n--- Captured Output ---\n" + result.stdout.strip() + "\n-----------------------"
+        perr(error_details, suggestion="Check the output above for clues. Ensure all prerequisites are met.")
+    if pip_args:
+        pinfo("Python packages installed successfully.")
+        _write_stamp(REQUIREMENTS_STAMP_FILE, requirements_key)
+    if not nltk_packages: return
     if result.returncode == 0:
          pinfo("NLTK data download command executed.")
     else:
          pwarn("NLTK data download command failed. Output:")
-         if result.stderr: print(result.stderr)
          if result.stdout: print(result.stdout)
          pwarn("Application might fail if NLTK data is missing.")
          pwarn("Suggestion: Check internet connection or run download manually: "
                f"\n        {python_exe} -m nltk.downloader punkt wordnet")
+
+@contextlib.contextmanager
+def _build_lock():
+    """Holds an OS-level exclusive lock on BUILD_LOCK_FILE so concurrent build.py runs don't race.
+
+    The OS drops the lock when the process exits, so a leftover lock file never blocks a later run.
+    """
+    lock_file = open(BUILD_LOCK_FILE, 'a+')
+    try:
+        try:
+            lock_file.seek(0)
+            if IS_WINDOWS:
+                import msvcrt
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            try: holder = lock_file.read().strip() or "unknown"
+            except OSError: holder = "unknown"
+            perr(f"Another build.py process (PID {holder}) is already installing dependencies.",
+                 suggestion="Wait for it to finish, then re-run this command.")
+        lock_file.truncate(0)
+        lock_file.write(str(os.getpid()))
+        lock_file.flush()
+        yield
+    finally:
+        lock_file.close()
+
+def _install_maven_deps_and_compile():
+    """Downloads the Java dependencies, then compiles against them (the 'setup' Java chain)."""
+    _install_maven_deps()
+    compile_java()
+
+def install(compile_after=False):
+    """Installs Java (Maven) and Python (pip) dependencies concurrently.
+
+    The two steps write to separate directories (LIB_DIR and VENV_DIR), so they run side by side.
+    With `compile_after` ('setup'), the Java sources are compiled as soon as Maven finishes, while
+    pip may still be running. Both chains are allowed to finish before any failure is reported,
+    so one cannot mask the other.
+    """
+    import concurrent.futures
+    def worker_step(step_func):
+        _WORKER_STEP.active = True
+        try:
+            step_func()
+        finally:
+            _WORKER_STEP.active = False
+    java_step = ("Maven + compile", _install_maven_deps_and_compile) if compile_after else ("Maven", _install_maven_deps)
+    with _build_lock(), concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        futures = {java_step[0]: executor.submit(worker_step, java_step[1]),
+                   "Python": executor.submit(worker_step, _install_python_deps)}
+    failed_steps = []
+    for step, future in futures.items():
+        try:
+            future.result()
+        except SystemExit: # Details were already reported by perr() inside the step
+            failed_steps.append(step)
+        except Exception as e:
+            pwarn(f"Unexpected error during {step} dependency installation: {e}")
+            failed_steps.append(step)
+    if failed_steps:
+        perr(f"{'Setup' if compile_after else 'Dependency installation'} failed for: {', '.join(failed_steps)}.",
+             suggestion="Check the errors reported above for each step.")
     pinfo("Dependency installation process finished.")
 
+def _rmtree_entries(path):
+    """Deletes a directory tree post-order with os.scandir + os.unlink/os.rmdir (no per-entry re-stat)."""
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                _rmtree_entries(entry.path)
+            else:
+                os.unlink(entry.path)
+    os.rmdir(path)
+
+def _fast_rmtree(path, parallel_parents=()):
+    """Removes a directory tree, deleting the subdirectories of `parallel_parents` concurrently first.
+
+    On Windows, 'rmdir /S /Q' is tried first: it deletes in one native call instead of a Python
+    round-trip per file. Falls back to shutil.rmtree on any error (e.g., read-only files).
+    """
+    import shutil
+    if IS_WINDOWS:
+        subprocess.run(["cmd", "/c", "rmdir", "/S", "/Q", path],
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+        if not os.path.exists(path): return
+        pv(f"'rmdir /S /Q' left {path} behind. Deleting the rest from Python.")
+    try:
+        subtrees = []
+        for parent in parallel_parents:
+            with os.scandir(parent) as it:
+                subtrees.extend(entry.path for entry in it if entry.is_dir(follow_symlinks=False))
+        if subtrees:
+            import concurrent.futures
+            with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+                list(executor.map(_rmtree_entries, subtrees))
+        _rmtree_entries(path)
+    except OSError as e:
+        pv(f"Fast removal of {path} failed ({e}). Falling back to shutil.rmtree.")
+        if os.path.exists(path): shutil.rmtree(path)
+
+def _discard_dir(path):
+    """Renames a directory to a '.trash-<pid>' sibling and deletes that in a background thread.
+
+    The original path is free again immediately (e.g. 'rebuild' compiles while the old classes
+    are still being deleted). The thread is non-daemon, so the script waits for it before exiting.
+    Deletes synchronously if the rename fails.
+    """
+    import glob
+    parent, name = os.path.split(path)
+    trash_path = os.path.join(parent, f".{name}.trash-{os.getpid()}")
+    try:
+        os.rename(path, trash_path)
+    except OSError as e:
+        pv(f"Could not move {path} aside ({e}). Deleting it in place.")
+        _fast_rmtree(path)
+        return
+    # Leftovers from runs that were interrupted before their deletion finished
+    stale = glob.glob(os.path.join(parent, glob.escape(f".{name}.trash-") + "*"))
+    def delete_trash():
+        for trash_dir in stale:
+            try:
+                _fast_rmtree(trash_dir)
+            except OSError as e:
+                pwarn(f"Could not remove {trash_dir}: {e}")
+    threading.Thread(target=delete_trash, name=f"discard-{name}").start()
+
 def clean_java_output():
     """Removes the compiled Java classes directory."""
     if os.path.exists(CLASSES_DIR):
         pinfo(f"Removing directory: {CLASSES_DIR}")
         try:
-            shutil.rmtree(CLASSES_DIR)
+            _discard_dir(CLASSES_DIR)
             pinfo("Classes directory removed.")
         except Exception as e:
             perr(f"Failed to remove directory {CLASSES_DIR}: {e}",
@@ -336,12 +1067,28 @@ def clean_java_output():
     else:
         pinfo(f"Directory not found, skipping removal: {CLASSES_DIR}")
 
-def clean_py_env():
-    """Removes the Python virtual environment directory."""
-    if os.path.exists(VENV_DIR):
+def clean_py_env(purge=False):
+    """Removes the Python virtual environment directory, or the VENV_DIR link to a cached venv.
+
+    The cached venv is kept (reinstalling the same requirements relinks it instantly) unless
+    `purge` is set, which deletes it so the next 'install' builds a fresh venv.
+    """
+    global _VENV_ENV_CACHE
+    _VENV_ENV_CACHE = None
+    if _is_dir_link(VENV_DIR):
+        slot_dir = os.path.realpath(VENV_DIR)
+        pinfo(f"Removing venv link: {VENV_DIR}" + ("" if purge else f" (the cached venv stays in {CACHE_ROOT})"))
+        try:
+            _remove_dir_link(VENV_DIR)
+            pinfo("Virtual environment link removed.")
+        except OSError as e:
+            perr(f"Failed to remove venv link {VENV_DIR}: {e}",
+                 suggestion="Check permissions or ensure venv not active elsewhere.")
+        if purge: _remove_cached_venv(slot_dir)
+    elif os.path.exists(VENV_DIR):
         pinfo(f"Removing directory: {VENV_DIR}")
         try:
-            shutil.rmtree(VENV_DIR)
+            _remove_venv_tree(VENV_DIR)
             pinfo("Virtual environment directory removed.")
         except Exception as e:
             perr(f"Failed to remove directory {VENV_DIR}: {e}",
@@ -349,6 +1096,61 @@ def clean_py_env():
     else:
         pinfo(f"Directory not found, skipping removal: {VENV_DIR}")
 
+def _write_javac_argfile(args_file, classpath_str, sources, extra_opts=()):
+    """Writes a javac argument file holding the compiler options, classpath, output dir and sources."""
+    # Forward slashes: backslash is an escape character in javac argument files
+    javac_args = [
+        "-Xlint:unchecked",  # Not '-nowarn': it would silence the unchecked warnings requested here
+        "-encoding", "UTF-8",
+        "-proc:none",        # No annotation processors are used; skip the discovery round
+        "-cp", f'"{classpath_str.replace(chr(92), "/")}"',
+        "-d", f'"{CLASSES_DIR.replace(chr(92), "/")}"',
+    ] + list(extra_opts) + [f'"{java_file.replace(chr(92), "/")}"' for java_file in sources]
+    with open(args_file, 'w', encoding='utf-8') as af:
+        af.write("\n".join(javac_args) + "\n")
+
+def _package_buckets(java_files, max_buckets):
+    """Splits sources into at most 'max_buckets' groups of similar size, keeping each package together."""
+    packages = collections.defaultdict(list)
+    for java_file in java_files:
+        packages[os.path.dirname(java_file)].append(java_file)
+    if len(packages) < 2 or max_buckets < 2: return [java_files]
+    buckets = [[] for _ in range(min(max_buckets, len(packages)))]
+    for package_files in sorted(packages.values(), key=len, reverse=True):
+        min(buckets, key=len).extend(package_files)
+    return buckets
+
+def _print_javac_output(result):
+    """Shows the output (e.g. -Xlint warnings) of a successful javac run whose output was captured."""
+    if result.stdout and result.stdout.strip(): print(result.stdout.rstrip())
+
+def _compile_parallel(buckets, classpath_str):
+    """Runs one javac per bucket concurrently. Returns True if every bucket compiled.
+
+    Each javac resolves the other buckets' classes from '-sourcepath' without emitting them
+    ('-implicit:none'), so the buckets do not write each other's class files.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    # -Xprefer:source: never read class files another bucket may still be writing
+    extra_opts = ["-sourcepath", f'"{SRC_ROOT.replace(chr(92), "/")}"', "-implicit:none", "-Xprefer:source"]
+    args_files = [os.path.join(CLASSES_DIR, f"sources-{i}.args") for i in range(len(buckets))]
+
+    def compile_bucket(args_file, sources):
+        _write_javac_argfile(args_file, classpath_str, sources, extra_opts)
+        # Captured so the concurrent compilers' output does not interleave
+        return run_cmd(["javac"] + JAVAC_JVM_OPTS + [f"@{args_file}"], cwd=PROJECT_ROOT,
+                       check=False, capture_output_override=True)
+
+    try:
+        with ThreadPoolExecutor(max_workers=len(buckets)) as pool:
+            results = list(pool.map(compile_bucket, args_files, buckets))
+    finally:
+        for args_file in args_files:
+            if os.path.exists(args_file): os.unlink(args_file)
+    if not all(result.returncode == 0 for result in results): return False
+    for result in results: _print_javac_output(result)
+    return True
+
 def compile_java():
     """Compiles the Java source files using javac with argument files to avoid Windows command line limits."""
     pinfo("\n--- Compiling Java Source Code ---")
@@ -370,80 +1172,86 @@ def compile_java():
 
     pinfo(f"Searching for Java source files in: {SRC_DIR}")
     if not os.path.isdir(SRC_DIR): perr(f"Java source directory not found: {SRC_DIR}")
-    java_files = [os.path.join(root, file) for root, _, files in os.walk(SRC_DIR) for file in files if file.endswith(".java")]
+    java_files = sorted(_iter_java(SRC_DIR)) # Stable order keeps the javac argfile reproducible
 
     if not java_files: pwarn(f"No '.java' files found in {SRC_DIR}. Nothing to compile."); return
 
     pinfo(f"Found {len(java_files)} Java source files.")
-    pv("Source files:\n" + "\n".join(f"  {f}" for f in java_files[:10]) + ("\n  ..." if len(java_files) > 10 else ""))
 
-    lib_jars = []
+    classpath_str, lib_jars = _get_classpath()
     if os.path.isdir(LIB_DIR):
-        lib_jars = [os.path.join(LIB_DIR, f) for f in os.listdir(LIB_DIR) if f.endswith(".jar")]
         pinfo(f"Found {len(lib_jars)} JARs in: {LIB_DIR}")
     else:
         pwarn(f"Java library directory not found: {LIB_DIR}. Compilation might fail.")
-
-    classpath_entries = [CLASSES_DIR] + lib_jars
-    classpath_str = os.pathsep.join(classpath_entries)
     pv(f"Classpath for compilation: {classpath_str}")
 
-    # Use local argument files to avoid Windows command line length limits
-    pinfo("Creating local argument files for compilation...")
-    
-    # Create argument files in project root with short names
-    sources_file = os.path.join(PROJECT_ROOT, "sources.txt")
-    classpath_file = os.path.join(PROJECT_ROOT, "classpath.txt")
-    
+    # Classes built by another JDK may target a newer class-file version than this one can load
+    compiler_key = _jdk_tool_key("javac") + [java_version_str]
+    build_cache = _load_build_cache()
+    source_stats = build_cache.get("sources", {})
+    if build_cache and build_cache.get("classpath") != classpath_str:
+        pinfo("Classpath changed since the last compilation. Recompiling all sources.")
+        stale_files = java_files
+    elif build_cache and build_cache.get("compiler") != compiler_key:
+        pinfo("Java compiler changed since the last compilation. Recompiling all sources.")
+        stale_files = java_files
+    else:
+        stale_files, touched_files = _stale_sources(java_files, source_stats)
+        # Record the new timestamps so touched sources are not re-hashed next time
+        if not stale_files and touched_files: _save_build_cache(java_files, classpath_str, compiler_key, source_stats)
+    if not stale_files: pinfo("All Java classes are up to date. Nothing to compile."); return
+    pinfo(f"{len(stale_files)} of {len(java_files)} source files need compiling.")
+    pv("Source files:\n" + "\n".join(f"  {f}" for f in stale_files[:10]) + ("\n  ..." if len(stale_files) > 10 else ""))
+
+    # One argument file holds every javac option and source path (Windows command line limits)
+    args_file = os.path.join(CLASSES_DIR, "sources.args")
+    buckets = _package_buckets(stale_files, min(os.cpu_count() or 1, JAVAC_MAX_WORKERS))
+
     try:
-        # Write source files to argument file with forward slashes
-        with open(sources_file, 'w', encoding='utf-8') as sf:
-            for java_file in java_files:
-                # Convert to forward slashes for Java compatibility
-                normalized_path = java_file.replace('\\', '/')
-                sf.write(f'"{normalized_path}"\n')
-        pv(f"Created sources argument file: {sources_file}")
-        
-        # Write classpath to argument file with forward slashes
-        with open(classpath_file, 'w', encoding='utf-8') as cf:
-            # Convert classpath to forward slashes
-            normalized_classpath = classpath_str.replace('\\', '/')
-            cf.write(f'-cp\n"{normalized_classpath}"\n')
-        pv(f"Created classpath argument file: {classpath_file}")
-        
-        # Build command using local argument files (short paths)
-        compile_cmd = [
-            "javac",
-            "-Xlint:unchecked",
-            "-encoding", "UTF-8",
-            "@classpath.txt",    # Just the filename, not full path
-            "-d", CLASSES_DIR,
-            "@sources.txt"       # Just the filename, not full path
-        ]
-        
-        pinfo("Starting Java compilation with argument files...")
+        if len(buckets) > 1:
+            pinfo(f"Compiling {len(buckets)} package groups in parallel...")
+            if _compile_parallel(buckets, classpath_str):
+                _save_build_cache(java_files, classpath_str, compiler_key, source_stats)
+                pinfo("Java compilation finished successfully.")
+                return
+            pwarn("Parallel compilation failed. Retrying with a single javac invocation...")
+
+        pinfo("Creating javac argument file for compilation...")
+        _write_javac_argfile(args_file, classpath_str, stale_files)
+        pv(f"Created javac argument file: {args_file}")
+
+        # -J options configure the javac JVM itself and are not accepted inside argument files
+        compile_cmd = ["javac"] + JAVAC_JVM_OPTS + [f"@{args_file}"]
+
+        pinfo("Starting Java compilation with argument file...")
         pv(f"Compilation command: {' '.join(compile_cmd)}")
-        
-        run_cmd(compile_cmd, cwd=PROJECT_ROOT, error_msg_on_fail="Java compilation failed")
+
+        _print_javac_output(run_cmd(compile_cmd, cwd=PROJECT_ROOT, error_msg_on_fail="Java compilation failed"))
+        _save_build_cache(java_files, classpath_str, compiler_key, source_stats)
         pinfo("Java compilation finished successfully.")
-        
+
     except Exception as e:
         perr(f"Compilation failed with error: {e}",
              suggestion="Check Java source files and classpath. Ensure all dependencies are available.")
     
     finally:
-        # Clean up local argument files
-        for arg_file in [sources_file, classpath_file]:
-            if os.path.exists(arg_file):
-                try:
-                    os.unlink(arg_file)
-                    pv(f"Cleaned up argument file: {arg_file}")
-                except Exception as e:
-                    pwarn(f"Could not remove argument file {arg_file}: {e}")
+        # Clean up the javac argument file (the classpath one is kept for reuse by 'run')
+        if os.path.exists(args_file):
+            try:
+                os.unlink(args_file)
+                pv(f"Cleaned up argument file: {args_file}")
+            except Exception as e:
+                pwarn(f"Could not remove argument file {args_file}: {e}")
 
 def java_runtime_opts(java_major_version):
     """Constructs appropriate Java VM options based on the detected major version."""
-    java_opts = ["-Xms256m", "-Xmx1424m", "-XX:-UseGCOverheadLimit"]
+    java_opts = ["-Xms512m", "-Xmx1424m"]
+    if java_major_version and java_major_version >= 11:
+        # G1 with string deduplication suits the many small JADE message objects; a 100 ms pause
+        # goal keeps agent message delivery smooth, and pre-touching the initial heap moves page
+        # faults to startup.
+        java_opts += ["-XX:+UseG1GC", "-XX:MaxGCPauseMillis=100", "-XX:+UseStringDeduplication",
+                      "-XX:+AlwaysPreTouch"]
     jade_opts = [
         "-jade_domain_df_maxresult", "1500", "-jade_core_messaging_MessageManager_poolsize", "10",
         "-jade_core_messaging_MessageManager_maxqueuesize", "2000000000",
@@ -469,8 +1277,12 @@ def java_runtime_opts(java_major_version):
          pwarn("Could not determine Java major version. Runtime might fail on Java 9+ without '--add-opens' flags.")
     return java_opts, jade_opts
 
-def run():
-    """Runs the compiled Java application using the Python venv's environment context."""
+def run(exec_jvm=False):
+    """Runs the compiled Java application using the Python venv's environment context.
+
+    With `exec_jvm` (POSIX only), this process is replaced by the JVM instead of waiting on it:
+    no Python process stays resident and signals such as Ctrl+C go straight to the JVM.
+    """
     pinfo("\n--- Running the Java Application ---")
 
     pinfo("Performing pre-run checks...")
@@ -488,33 +1300,40 @@ def run():
 
     if not os.path.isdir(VENV_DIR): perr(f"Python venv not found: {VENV_DIR}", suggestion="Run 'install' first.")
     if not os.path.isdir(CLASSES_DIR): perr(f"Compiled classes dir not found: {CLASSES_DIR}", suggestion="Run 'compile' or 'setup' first.")
-    if not os.listdir(CLASSES_DIR): perr(f"Compiled classes dir is empty: {CLASSES_DIR}", suggestion="Run 'compile' or 'setup' first.")
-    if not os.path.isdir(LIB_DIR) or not any(f.endswith(".jar") for f in os.listdir(LIB_DIR)):
+    if not _has_class_files(CLASSES_DIR): perr(f"No compiled classes found in: {CLASSES_DIR}", suggestion="Run 'compile' or 'setup' first.")
+    classpath_str, lib_jars = _get_classpath()
+    if not lib_jars:
         pwarn(f"Java library dir '{LIB_DIR}' missing or empty. Run 'install'. Application might fail.")
 
     pinfo("Pre-run checks passed.")
     pinfo("Preparing execution environment...")
     java_env = venv_env_vars()
-    if not java_env: perr("Failed to create execution environment from Python venv.", suggestion=f"Ensure venv '{VENV_DIR}' is valid. Try 'clean-python' then 'install'.")
+    if not java_env: perr("Failed to create execution environment from Python venv.", suggestion=f"Ensure venv '{VENV_DIR}' is valid. Try 'clean-python --purge' then 'install'.")
     pinfo("Execution environment prepared.")
 
-    lib_jars = []
-    if os.path.isdir(LIB_DIR): lib_jars = [os.path.join(LIB_DIR, f) for f in os.listdir(LIB_DIR) if f.endswith(".jar")]
-    classpath_entries = [CLASSES_DIR] + lib_jars
-    classpath_str = os.pathsep.join(classpath_entries)
     pv(f"Runtime Classpath: {classpath_str}")
+    # Java 9+ launchers read @argfiles, which keeps a long classpath off the command line
+    classpath_args = [f"@{CLASSPATH_ARGFILE}"] if java_major and java_major >= 9 and os.path.exists(CLASSPATH_ARGFILE) else ["-cp", classpath_str]
 
     java_opts, jade_opts = java_runtime_opts(java_major)
-    run_cmd_list = ["java"] + java_opts + ["-cp", classpath_str, JAVA_MAIN_CLASS] + jade_opts + [JAVA_MAIN_AGENT]
+    run_cmd_list = ["java"] + java_opts + classpath_args + [JAVA_MAIN_CLASS] + jade_opts + [JAVA_MAIN_AGENT]
 
     pinfo("Starting Java application...")
     pv("Full command: " + " ".join(run_cmd_list))
 
+    if exec_jvm and IS_WINDOWS: pwarn("--exec is not supported on Windows. Running the JVM as a child process.")
+    elif exec_jvm:
+        sys.stdout.flush(); sys.stderr.flush() # exec discards unflushed buffers
+        try:
+            os.execvpe(_which("java") or "java", run_cmd_list, java_env)
+        except OSError as e:
+            perr(f"Failed to exec the Java application: {e}")
+
     try:
         process = run_cmd(run_cmd_list, check=False, env=java_env, error_msg_on_fail="Java application execution failed")
         if process.returncode == 0: pinfo("\nJava application finished successfully.")
         else: pwarn(f"\nJava application exited with code: {process.returncode}")
-        if not VERBOSE and process.returncode != 0 and process.stderr: print("---\n" + process.stderr.strip() + "\n---")
+        if not VERBOSE and process.returncode != 0 and process.stdout: print("---\n" + process.stdout.strip() + "\n---")
     except KeyboardInterrupt: pinfo("\nJava application interrupted by user (Ctrl+C).")
     except Exception as e: perr(f"An unexpected error occurred while running Java: {e}")
 
@@ -522,6 +1341,14 @@ def info():
     """Displays detected environment information and key project paths."""
     pinfo("\n--- Environment and Project Information ---")
 
+    # Each probe may have to start a JVM or interpreter; run them side by side (results are cached)
+    import concurrent.futures
+    venv_python_exe = py_exe_path()
+    probes = [fetch_java_version_str, fetch_mvn_version_str]
+    if os.path.exists(venv_python_exe): probes.append(functools.partial(fetch_py_version, venv_python_exe))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+        list(executor.map(lambda probe: probe(), probes))
+
     print("\n[ Tools ]")
     java_version_str = fetch_java_version_str()
     if java_version_str is None: print("  Java: Not Found (Required: JDK 8+)"); print("        Suggestion: Install JDK 8+ and add to PATH.")
@@ -531,12 +1358,12 @@ def info():
         status = ""
         if java_major and java_major < MIN_JAVA_VERSION: status = f" [ERROR: Requires {MIN_JAVA_VERSION}+]"
         elif not java_major: status = " [WARN: Could not parse major version]"
-        print(f"  Java: {java_version_str}{status} (via 'java -version')")
+        print(f"  Java: {java_version_str}{status} (via {_VERSION_SOURCES.get('java', 'unknown source')})")
 
     mvn_version_str = fetch_mvn_version_str()
     if mvn_version_str is None: print("  Maven: Not Found (Required for 'install')"); print("         Suggestion: Install Apache Maven and add to PATH (https://maven.apache.org/install.html).")
     elif mvn_version_str in ["Error", "Unknown format"]: print(f"  Maven: Error detecting version ({mvn_version_str})")
-    else: print(f"  Maven: {mvn_version_str} (via 'mvn --version')")
+    else: print(f"  Maven: {mvn_version_str} (via {_VERSION_SOURCES.get('mvn', 'unknown source')})")
 
     print("\n[ Python ]")
     print(f"  Required Version (for script & venv): {ALLOWED_PYTHON_VERSIONS_STR}")
@@ -545,25 +1372,25 @@ def info():
     if script_py_ver_tuple not in ALLOWED_PYTHON_VERSIONS: status_script = f" [ERROR: MUST BE {ALLOWED_PYTHON_VERSIONS_STR}]"
     print(f"  Running Script With: {script_py_ver_str or 'Unknown'} (at {sys.executable}){status_script}")
 
-    venv_python_exe = py_exe_path()
     if os.path.exists(VENV_DIR) and os.path.exists(venv_python_exe):
         venv_py_ver_str, venv_py_ver_tuple = fetch_py_version(venv_python_exe)
         status_venv = ""
         if not venv_py_ver_tuple: status_venv = " [WARN: Error getting version]"
-        elif venv_py_ver_tuple not in ALLOWED_PYTHON_VERSIONS: status_venv = f" [WARN: Mismatch! Expected {ALLOWED_PYTHON_VERSIONS_STR}. Run 'clean-python' then 'install']"
+        elif venv_py_ver_tuple not in ALLOWED_PYTHON_VERSIONS: status_venv = f" [WARN: Mismatch! Expected {ALLOWED_PYTHON_VERSIONS_STR}. Run 'clean-python --purge' then 'install']"
         print(f"  Virtual Env Python: {venv_py_ver_str or 'Unknown'} (at {venv_python_exe}){status_venv}")
-    elif os.path.exists(VENV_DIR): print(f"  Virtual Env Python: Venv dir exists, but exe missing! ({venv_python_exe}). Suggestion: Run 'clean-python' then 'install'.")
+    elif os.path.exists(VENV_DIR): print(f"  Virtual Env Python: Venv dir exists, but exe missing! ({venv_python_exe}). Suggestion: Run 'clean-python --purge' then 'install'.")
     else: print(f"  Virtual Env Python: Not found (at {VENV_DIR}). Suggestion: Run 'install'.")
 
-    print("\n[ Project Paths ]")
-    print(f"  Project Root:      {os.path.abspath(PROJECT_ROOT)}")
-    print(f"  Python Virtualenv: {os.path.abspath(VENV_DIR)}")
-    print(f"  Java Source Dir:   {os.path.abspath(SRC_DIR)}")
-    print(f"  Java Libraries:    {os.path.abspath(LIB_DIR)}")
-    print(f"  Compiled Classes:  {os.path.abspath(CLASSES_DIR)}")
-    print(f"  Maven POM File:    {os.path.abspath(POM_FILE)}")
-    print(f"  Python Req. File:  {os.path.abspath(REQUIREMENTS_FILE)}")
-    print("\n" + "-" * 40 + "\n")
+    _OUT("\n".join([
+        "\n[ Project Paths ]",
+        f"  Project Root:      {os.path.abspath(PROJECT_ROOT)}",
+        f"  Python Virtualenv: {os.path.abspath(VENV_DIR)}",
+        f"  Java Source Dir:   {os.path.abspath(SRC_DIR)}",
+        f"  Java Libraries:    {os.path.abspath(LIB_DIR)}",
+        f"  Compiled Classes:  {os.path.abspath(CLASSES_DIR)}",
+        f"  Maven POM File:    {os.path.abspath(POM_FILE)}",
+        f"  Python Req. File:  {os.path.abspath(REQUIREMENTS_FILE)}",
+        "\n" + "-" * 40 + "\n\n"]))
 
 # --- Main Execution ---
 
@@ -576,12 +1403,13 @@ if __name__ == "__main__":
                      f"        You are currently using Python {sys.version_info.major}.{sys.version_info.minor} "
                      f"(from {sys.executable}).")
         suggestion = f"Please re-run using a Python {ALLOWED_PYTHON_VERSIONS_STR} executable.\n"
-        if platform.system() == "Windows": suggestion += "        Example: py -3.9 build.py <command> OR py -3.10 build.py <command>"
+        if IS_WINDOWS: suggestion += "        Example: py -3.9 build.py <command> OR py -3.10 build.py <command>"
         else: suggestion += f"        Example: python3.9 build.py <command> OR python3.10 build.py <command>"
         print(f"\n[FATAL ERROR] {error_msg}", file=sys.stderr)
         print(f"\n  Suggestion: {suggestion}", file=sys.stderr)
         sys.exit(1)
 
+    import textwrap
     parser = argparse.ArgumentParser(
         description=textwrap.dedent(__doc__),
         formatter_class=argparse.RawTextHelpFormatter,
@@ -594,18 +1422,22 @@ if __name__ == "__main__":
         help=textwrap.dedent(f"""
 Action to perform (default: shows help):
   install       - Create/update Python venv ({ALLOWED_PYTHON_VERSIONS_STR}), install pip/Maven deps.
-  compile       - Compile Java code ('{os.path.basename(SRC_DIR)}' -> '{os.path.basename(CLASSES_DIR)}'). Needs JDK {MIN_JAVA_VERSION}+.
+  compile       - Compile changed Java code ('{os.path.basename(SRC_DIR)}' -> '{os.path.basename(CLASSES_DIR)}'). Needs JDK {MIN_JAVA_VERSION}+.
   run           - Execute Java app. Needs JDK {MIN_JAVA_VERSION}+, classes, venv.
-  rebuild       - Clean Java classes, then compile.
-  setup         - Run 'install', then 'compile'. For initial setup.
+  rebuild       - Clean Java classes, then compile everything.
+  setup         - Run 'install' and 'compile' (compilation overlaps the pip install). For initial setup.
   clean         - Remove Java classes and Python venv.
   clean-java    - Remove only compiled Java classes ('{os.path.basename(CLASSES_DIR)}').
-  clean-python  - Remove only Python venv ('{os.path.basename(VENV_DIR)}').
+  clean-python  - Remove only Python venv ('{os.path.basename(VENV_DIR)}'); with --purge also its cached copy.
   info          - Show detected versions and project paths.
   help          - Display this help message.
 """)
     )
     parser.add_argument("-v", "--verbose", action="store_true", help="Enable detailed output.")
+    parser.add_argument("--exec", dest="exec_jvm", action="store_true",
+                        help="With 'run' (POSIX only): replace this script's process with the JVM.")
+    parser.add_argument("--purge", action="store_true",
+                        help="With 'clean'/'clean-python': also delete the cached venv .venv links to.")
     args = parser.parse_args()
     VERBOSE = args.verbose
 
@@ -615,30 +1447,30 @@ Action to perform (default: shows help):
 
     if VERBOSE: pinfo(f"Verbose mode enabled. Running command '{args.command}'...")
 
+    import datetime
     start_time = datetime.datetime.now()
     pv(f"\n>>> Executing Command: {args.command} <<<")
 
     try:
         if args.command == "install": install()
         elif args.command == "compile": compile_java()
-        elif args.command == "run": run()
+        elif args.command == "run": run(exec_jvm=args.exec_jvm)
         elif args.command == "rebuild":
             clean_java_output()
             compile_java()
             pinfo("Project rebuild complete.")
         elif args.command == "setup":
-            install()
-            compile_java()
+            install(compile_after=True)
             pinfo("Project setup complete.")
         elif args.command == "clean":
             clean_java_output()
-            clean_py_env()
+            clean_py_env(purge=args.purge)
             pinfo("Project clean complete (classes and venv removed).")
         elif args.command == "clean-java":
             clean_java_output()
             pinfo("Java clean complete (classes removed).")
         elif args.command == "clean-python":
-            clean_py_env()
+            clean_py_env(purge=args.purge)
             pinfo("Python clean complete (venv removed).")
         elif args.command == "info": info()
 